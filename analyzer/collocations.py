@@ -22,16 +22,30 @@ merged and counts accumulated.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import Counter, defaultdict
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
 from natasha import Doc
 
+from .soa import POS_IDS, build_soa
+
 # POS tags for adjective-like modifiers (ADJ + participles tagged as VERB)
-ADJ_LIKE_POS = ("ADJ", "VERB")
+ADJ_LIKE_POS = frozenset(("ADJ", "VERB"))
+# POS tags that can head a collocation
+NOUN_POS = frozenset(("NOUN", "PROPN"))
+_NOUN_CODES = np.array(sorted(POS_IDS[p] for p in NOUN_POS), dtype=np.int8)
+_ADJ_CODE = POS_IDS["ADJ"]
+
+# Tokens scanned on each side of a noun by the window strategy
+WINDOW = 2
 
 
-def extract_noun_adj_pairs(doc: Doc) -> dict[str, Any]:
+def extract_noun_adj_pairs(
+    doc: Doc, soa: dict[str, np.ndarray] | None = None
+) -> dict[str, Any]:
     """
     Return:
     {
@@ -56,108 +70,158 @@ def extract_noun_adj_pairs(doc: Doc) -> dict[str, Any]:
     }
     """
 
+    if soa is None:
+        soa = build_soa(doc)
+    # Plain lists: scalar indexing is faster on lists than on ndarrays
+    lemma_lc = soa["lemma_lc"].tolist()
+
     # ── pair_counter[(noun_lemma, adj_lemma)] → count ─────────────
     pair_counter: Counter = Counter()
     # Keep a few example surface-form phrases per pair
     pair_examples: dict[tuple[str, str], list[str]] = defaultdict(list)
 
     # ── Strategy 1: dependency-based ──────────────────────────────
-    for sent in doc.sents:
-        # Build token-id → token map for this sentence
-        id_to_token = {t.id: t for t in sent.tokens}
-
-        for token in sent.tokens:
-            if token.rel == "amod" and token.pos in ADJ_LIKE_POS:
-                head = id_to_token.get(token.head_id)
-                if head and head.pos in ("NOUN", "PROPN"):
-                    noun_lemma = (head.lemma or head.text).lower()
-                    adj_lemma = (token.lemma or token.text).lower()
-                    pair = (noun_lemma, adj_lemma)
-                    pair_counter[pair] += 1
-                    if len(pair_examples[pair]) < 3:
-                        # Reconstruct a small surface phrase
-                        tokens_sorted = sorted(
-                            [head, token], key=lambda t: t.start if hasattr(t, 'start') and t.start else 0
-                        )
-                        phrase = " ".join(t.text for t in tokens_sorted)
-                        if phrase not in pair_examples[pair]:
-                            pair_examples[pair].append(phrase)
-
-    # ── Strategy 2: window-based (±2 tokens) ─────────────────────
-    tokens = list(doc.tokens)
-    for i, token in enumerate(tokens):
-        if token.pos not in ("NOUN", "PROPN"):
+    # Matches are collected and counted with one Counter.update() call
+    dep_matches: list[tuple[str, str]] = []
+    for sent, offset in zip(doc.sents, soa["sent_starts"].tolist()):
+        sent_tokens = sent.tokens
+        amod_positions = [
+            k for k, t in enumerate(sent_tokens)
+            if t.rel == "amod" and t.pos in ADJ_LIKE_POS
+        ]
+        if not amod_positions:
             continue
-        noun_lemma = (token.lemma or token.text).lower()
+        # Build token-id → position map only for sentences that need it
+        id_to_pos = {t.id: k for k, t in enumerate(sent_tokens)}
 
-        # Look in window [i-2 .. i+2]
-        start = max(0, i - 2)
-        end = min(len(tokens), i + 3)
-        for j in range(start, end):
-            if j == i:
-                continue
-            other = tokens[j]
-            # Only ADJ in window (not VERB) to avoid false positives when
-            # a participle modifies a different noun nearby, e.g. «листья вдоль запертых окон»
-            if other.pos != "ADJ":
+        for k in amod_positions:
+            token = sent_tokens[k]
+            h = id_to_pos.get(token.head_id)
+            if h is None:
                 continue
-            adj_lemma = (other.lemma or other.text).lower()
-            pair = (noun_lemma, adj_lemma)
-            # Only add if not already found by dependency method
-            if pair not in pair_counter:
-                pair_counter[pair] += 1
+            head = sent_tokens[h]
+            if head.pos in NOUN_POS:
+                pair = (lemma_lc[offset + h], lemma_lc[offset + k])
+                dep_matches.append(pair)
                 if len(pair_examples[pair]) < 3:
-                    lo, hi = min(i, j), max(i, j)
-                    phrase = " ".join(t.text for t in tokens[lo : hi + 1])
+                    # Reconstruct a small surface phrase
+                    tokens_sorted = sorted(
+                        [head, token], key=lambda t: t.start if hasattr(t, 'start') and t.start else 0
+                    )
+                    phrase = " ".join(t.text for t in tokens_sorted)
                     if phrase not in pair_examples[pair]:
                         pair_examples[pair].append(phrase)
+    pair_counter.update(dep_matches)
+
+    # ── Strategy 2: window-based (±2 tokens) ─────────────────────
+    # Pairs not found by the dependency method count once each
+    window_matches: list[tuple[str, str]] = []
+    window_seen: set[tuple[str, str]] = set()
+    texts = soa["text"].tolist()
+    for i, j in _window_pairs(soa["pos_code"], WINDOW):
+        pair = (lemma_lc[i], lemma_lc[j])
+        # Only add if not already found by dependency method
+        if pair in pair_counter or pair in window_seen:
+            continue
+        window_seen.add(pair)
+        window_matches.append(pair)
+        lo, hi = min(i, j), max(i, j)
+        pair_examples[pair].append(" ".join(texts[lo : hi + 1]))
+    pair_counter.update(window_matches)
 
     # ── Build output structures ───────────────────────────────────
-    noun_adj_index: dict[str, list[dict]] = defaultdict(list)
-    adj_noun_index: dict[str, list[dict]] = defaultdict(list)
+    noun_adj_index: dict[str, list[dict]] = {}
+    adj_noun_index: dict[str, list[dict]] = {}
     pair_list = []
+    na_setdefault = noun_adj_index.setdefault
+    an_setdefault = adj_noun_index.setdefault
+    pair_list_append = pair_list.append
 
+    # most_common() yields pairs by count desc, so appending in this order
+    # leaves every per-noun and per-adjective list already sorted.
     for (noun, adj), count in pair_counter.most_common():
+        # The same examples list is shared by pair_list and noun_adj_index
+        # entries; it is never mutated past this point, so no copy is made.
         examples = pair_examples.get((noun, adj), [])
-        pair_list.append(
+        pair_list_append(
             {"noun": noun, "adj": adj, "count": count, "examples": examples}
         )
-        noun_adj_index[noun].append(
+        na_setdefault(noun, []).append(
             {"adj": adj, "count": count, "examples": examples}
         )
-        adj_noun_index[adj].append({"noun": noun, "count": count})
-
-    # Sort each noun's adjectives by count descending
-    for noun in noun_adj_index:
-        noun_adj_index[noun].sort(key=lambda x: x["count"], reverse=True)
-    for adj in adj_noun_index:
-        adj_noun_index[adj].sort(key=lambda x: x["count"], reverse=True)
+        an_setdefault(adj, []).append({"noun": noun, "count": count})
 
     return {
-        "noun_adj_index": dict(noun_adj_index),
-        "adj_noun_index": dict(adj_noun_index),
+        "noun_adj_index": noun_adj_index,
+        "adj_noun_index": adj_noun_index,
         "pair_list": pair_list,
         "total_pairs": sum(pair_counter.values()),
         "unique_pairs": len(pair_counter),
     }
 
 
+def _window_pairs(pos_codes: np.ndarray, window: int) -> list[tuple[int, int]]:
+    """
+    Return (noun_index, adj_index) for every NOUN/PROPN token with an ADJ
+    token within ±*window* positions, ordered by noun index, then adj index.
+
+    Works on the int8 "pos_code" column, so all masking and index
+    arithmetic runs in NumPy.  Only ADJ is matched (not VERB) to avoid
+    false positives when a participle modifies a different noun nearby,
+    e.g. «листья вдоль запертых окон».
+    """
+    noun_idx = np.flatnonzero(np.isin(pos_codes, _NOUN_CODES))
+    adj_idx = np.flatnonzero(pos_codes == _ADJ_CODE)
+    # For each offset d, nouns at i with an adjective at i + d
+    noun_parts = []
+    adj_parts = []
+    for d in range(-window, window + 1):
+        if d == 0:
+            continue
+        nouns_at = np.intersect1d(noun_idx, adj_idx - d, assume_unique=True)
+        noun_parts.append(nouns_at)
+        adj_parts.append(nouns_at + d)
+    noun_pos = np.concatenate(noun_parts)
+    adj_pos = np.concatenate(adj_parts)
+    order = np.lexsort((adj_pos, noun_pos))
+    return list(zip(noun_pos[order].tolist(), adj_pos[order].tolist()))
+
+
+def build_noun_lookup(noun_adj_index: dict[str, list[dict]]) -> list[tuple[str, int]]:
+    """
+    Return (noun, position) pairs sorted by noun, for prefix search with
+    bisect.  *position* is the noun's place in *noun_adj_index* and keeps
+    prefix results in the same order as a scan of the index would.
+    Build once per analysis and pass to search_adjectives_for_noun().
+    """
+    return sorted((noun, i) for i, noun in enumerate(noun_adj_index))
+
+
 def search_adjectives_for_noun(
-    noun_adj_index: dict[str, list[dict]], query: str, limit: int = 20
+    noun_adj_index: dict[str, list[dict]],
+    query: str,
+    limit: int = 20,
+    noun_lookup: list[tuple[str, int]] | None = None,
 ) -> list[dict]:
     """
     Given a user query (a noun), return its top adjectives.
-    Tries exact match first, then prefix match.
+    Tries exact match first, then prefix match.  With *noun_lookup*
+    (see build_noun_lookup) the prefix match is a binary search instead
+    of a scan over every noun.
     """
     query_lower = query.strip().lower()
     if query_lower in noun_adj_index:
         return noun_adj_index[query_lower][:limit]
 
     # Fuzzy: prefix match
+    if noun_lookup is None:
+        prefixed = [noun for noun in noun_adj_index if noun.startswith(query_lower)]
+    else:
+        lo, hi = _prefix_range(noun_lookup, query_lower)
+        prefixed = [noun for noun, _ in sorted(noun_lookup[lo:hi], key=itemgetter(1))]
     matches = []
-    for noun, adjs in noun_adj_index.items():
-        if noun.startswith(query_lower):
-            matches.extend(adjs)
+    for noun in prefixed:
+        matches.extend(noun_adj_index[noun])
     # Deduplicate & sort
     seen = set()
     result = []
@@ -168,3 +232,19 @@ def search_adjectives_for_noun(
         if len(result) >= limit:
             break
     return result
+
+
+def _prefix_range(noun_lookup: list[tuple[str, int]], prefix: str) -> tuple[int, int]:
+    """Return the [lo, hi) slice of *noun_lookup* whose nouns start with *prefix*."""
+    if not prefix:
+        return 0, len(noun_lookup)
+    lo = bisect_left(noun_lookup, (prefix,))
+    last = ord(prefix[-1])
+    if last == 0x10FFFF:
+        hi = lo
+        while hi < len(noun_lookup) and noun_lookup[hi][0].startswith(prefix):
+            hi += 1
+        return lo, hi
+    # Smallest string greater than every string with this prefix
+    upper = prefix[:-1] + chr(last + 1)
+    return lo, bisect_left(noun_lookup, (upper,), lo)
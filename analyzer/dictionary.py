@@ -12,13 +12,19 @@ from __future__ import annotations
 from collections import Counter, defaultdict
 from typing import Any
 
+import numpy as np
 from natasha import Doc
 
+from .soa import build_soa
+
 # POS tags to include in the dictionary (skip punctuation, symbols)
 INCLUDE_POS = {"NOUN", "ADJ", "VERB", "ADV", "PROPN", "PRON", "NUM", "DET", "INTJ"}
+_INCLUDE_POS_LIST = sorted(INCLUDE_POS)
 
 
-def build_dictionary(doc: Doc) -> list[dict[str, Any]]:
+def build_dictionary(
+    doc: Doc, soa: dict[str, np.ndarray] | None = None
+) -> list[dict[str, Any]]:
     """
     Return a list of dictionary entries sorted by frequency (desc):
     [
@@ -32,55 +38,51 @@ def build_dictionary(doc: Doc) -> list[dict[str, Any]]:
         …
     ]
     """
-    # (lemma, pos) → data
-    entries: dict[tuple[str, str], dict] = {}
+    if soa is None:
+        soa = build_soa(doc)
+    texts = soa["text"]
+
+    # Select dictionary tokens with one vectorised mask, then pull the
+    # three columns we need.  Counting and first-occurrence lookup use the
+    # C-implemented Counter / dict builders; surface forms are collected
+    # once per distinct (key, form) pair rather than once per token.
+    idxs = np.flatnonzero(np.isin(soa["pos"], _INCLUDE_POS_LIST))
+    if not idxs.size:
+        return []
+    poss = soa["pos"][idxs].tolist()
+    words = texts[idxs].tolist()
+    lemmas = soa["lemma_lc"][idxs].tolist()
+    forms = [text.lower() for text in words]
+    idxs = idxs.tolist()
+    keys = list(zip(lemmas, poss))
+
+    # (lemma, pos) → count, in first-occurrence order for stable ties
+    freq = Counter(keys)
+    # (lemma, pos) → set of surface forms (loop over distinct pairs only)
     form_sets: dict[tuple[str, str], set] = defaultdict(set)
-    freq: Counter = Counter()
+    for key, form in set(zip(keys, forms)):
+        form_sets[key].add(form)
+    # (lemma, pos) → token index of first occurrence (reversed: first wins)
+    first_idx = dict(zip(reversed(keys), reversed(idxs)))
 
-    for token in doc.tokens:
-        if token.pos not in INCLUDE_POS:
-            continue
-        lemma = (token.lemma or token.text).lower()
-        pos = token.pos
+    result = []
+    for (lemma, pos), cnt in freq.most_common():
         key = (lemma, pos)
-        freq[key] += 1
-        form_sets[key].add(token.text.lower())
-
-        # Store first occurrence's context as example
-        if key not in entries:
-            example = _extract_context(doc, token, window=6)
-            entries[key] = {
+        result.append(
+            {
                 "lemma": lemma,
                 "pos": pos,
-                "count": 0,
-                "surface_forms": [],
-                "example": example,
+                "count": cnt,
+                "surface_forms": sorted(form_sets[key]),
+                "example": _extract_context(texts, first_idx[key], window=6),
             }
-
-    # Merge counts and forms
-    result = []
-    for key, cnt in freq.most_common():
-        entry = entries[key]
-        entry["count"] = cnt
-        entry["surface_forms"] = sorted(form_sets[key])
-        result.append(entry)
+        )
 
     return result
 
 
-def _extract_context(doc: Doc, target_token, window: int = 6) -> str:
-    """Return a small snippet of text around *target_token*."""
-    tokens = doc.tokens
-    # Find index of target token
-    idx = None
-    for i, t in enumerate(tokens):
-        if t is target_token:
-            idx = i
-            break
-    if idx is None:
-        return target_token.text
-
+def _extract_context(texts, idx: int, window: int = 6) -> str:
+    """Return a small snippet of text around the token at position *idx*."""
     start = max(0, idx - window)
-    end = min(len(tokens), idx + window + 1)
-    words = [t.text for t in tokens[start:end]]
-    return " ".join(words)
+    end = min(len(texts), idx + window + 1)
+    return " ".join(texts[start:end])
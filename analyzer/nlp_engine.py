@@ -13,6 +13,9 @@ POS tags follow Universal Dependencies v2:
   NOUN, VERB, ADJ, ADV, PROPN, DET, ADP, PRON, CCONJ, SCONJ, PART, NUM, PUNCT, SYM, X, INTJ
 """
 
+import os
+import sys
+
 from natasha import (
     Segmenter,
     MorphVocab,
@@ -29,6 +32,12 @@ _emb: NewsEmbedding | None = None
 _morph_tagger: NewsMorphTagger | None = None
 _syntax_parser: NewsSyntaxParser | None = None
 
+# ── Lemma cache: (lowercased form, pos, feats) → (lemma, lemma_lc) ─
+# Word forms repeat heavily in running text, so most tokens can skip
+# MorphVocab.  The cache is cleared wholesale once it reaches the cap.
+_LEMMA_CACHE_MAX = 200_000
+_lemma_cache: dict[tuple, tuple[str, str]] = {}
+
 
 def _ensure_loaded():
     """Lazy-load heavy models on first call."""
@@ -47,16 +56,48 @@ def _ensure_loaded():
 def process_text(text: str) -> Doc:
     """
     Run the full Natasha pipeline on *text* and return a Doc whose
-    tokens carry: text, pos, feats, lemma, id, head_id, rel.
+    tokens carry: text, pos, feats, lemma, id, head_id, rel — plus
+    `_lemma_lc`, the lowercased lemma (or text) used by all analyzers.
     """
     _ensure_loaded()
     doc = Doc(text)
     doc.segment(_segmenter)
     doc.tag_morph(_morph_tagger)
 
-    # Lemmatise each token using MorphVocab
+    # Lemmatise each token using MorphVocab, reusing cached lemmas for
+    # forms already seen with the same POS and grammatical features.
+    # The lowercased lemma is cached alongside, so .lower() runs once
+    # per distinct form rather than once per token per analyzer.
+    cache = _lemma_cache
     for token in doc.tokens:
-        token.lemmatize(_morph_vocab)
+        feats = token.feats
+        key = (token.text.lower(), token.pos, tuple(feats.items()) if feats else None)
+        cached = cache.get(key)
+        if cached is None:
+            token.lemmatize(_morph_vocab)
+            cached = (token.lemma, (token.lemma or key[0]).lower())
+            if len(cache) >= _LEMMA_CACHE_MAX:
+                cache.clear()
+            cache[key] = cached
+        token.lemma, token._lemma_lc = cached
 
     doc.parse_syntax(_syntax_parser)
+
+    # Intern tag strings: the analyzers compare them against string
+    # constants, and CPython's str equality / set lookup short-circuits
+    # on identity
+    intern = sys.intern
+    # (a token outside every sentence is never tagged: pos/rel stay None)
+    for token in doc.tokens:
+        if token.pos:
+            token.pos = intern(token.pos)
+        if token.rel:
+            token.rel = intern(token.rel)
     return doc
+
+
+# Load models at import time so server workers pay the start-up cost at
+# boot rather than on the first request.  Set NLP_PRELOAD=0 to keep lazy
+# loading (e.g. for scripts that never call process_text).
+if os.getenv("NLP_PRELOAD", "1") == "1":
+    _ensure_loaded()
@@ -8,9 +8,11 @@ the Flask views and JSON export.
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .nlp_engine import process_text
+from .soa import build_soa
 from .dictionary import build_dictionary
 from .statistics import compute_statistics
 from .collocations import extract_noun_adj_pairs
@@ -43,14 +45,18 @@ def analyze_text(text: str, top_n: int = 100) -> dict[str, Any]:
     # 1. Run NLP pipeline
     doc = process_text(text)
 
-    # 2. Build dictionary
-    dictionary = build_dictionary(doc)
+    # Extract token attributes into per-column arrays once for all analyzers
+    soa = build_soa(doc)
 
-    # 3. Compute statistics
-    stats = compute_statistics(doc, top_n=top_n)
-
-    # 4. Extract noun-adjective collocations
-    collocations = extract_noun_adj_pairs(doc)
+    # 2–4. Dictionary, statistics and collocations only read the Doc,
+    #      so they run side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_dict = executor.submit(build_dictionary, doc, soa=soa)
+        f_stats = executor.submit(compute_statistics, doc, top_n=top_n, soa=soa)
+        f_coll = executor.submit(extract_noun_adj_pairs, doc, soa=soa)
+        dictionary = f_dict.result()
+        stats = f_stats.result()
+        collocations = f_coll.result()
 
     elapsed = round(time.perf_counter() - t0, 2)
 
@@ -0,0 +1,73 @@
+"""
+Struct-of-arrays view of a Natasha Doc.
+
+Every analyzer reads the same few token attributes (text, lemma, pos).
+Instead of each one walking `doc.tokens` and doing attribute lookups per
+token, the pipeline extracts each attribute they use into its own NumPy array
+once and hands the bundle to the analyzers, which can then select tokens
+with vectorised masks (`np.isin`, `np.flatnonzero`, …).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from natasha import Doc
+
+# Universal Dependencies v2 POS tags → small integer codes ("pos_code"
+# column), so POS masks compare int8 values instead of Python strings.
+# Tags outside this list get code -1.
+POS_TAGS = (
+    "NOUN", "VERB", "ADJ", "ADV", "PROPN", "DET", "ADP", "PRON", "AUX",
+    "CCONJ", "SCONJ", "PART", "NUM", "PUNCT", "SYM", "X", "INTJ",
+)
+POS_IDS = {tag: i for i, tag in enumerate(POS_TAGS)}
+
+
+def build_soa(doc: Doc) -> dict[str, np.ndarray]:
+    """
+    Return one array per token attribute, all of length len(doc.tokens):
+    {
+        "text":    object array of surface forms,
+        "lemma_lc": object array of (lemma or text).lower(),
+        "pos":     object array of UD POS tags,
+        "pos_code": int8 array of POS_IDS codes (-1 for unknown tags),
+        "sent_starts": int array — doc.tokens index of each sentence's first
+                       token (-1 for an empty sentence),
+    }
+    """
+    tokens = doc.tokens
+    # Sentence starts come from token identity, not cumulative lengths:
+    # Natasha leaves a token that straddles a sentence boundary in
+    # doc.tokens but in no sentence, which would shift every later offset
+    index_of = {id(t): i for i, t in enumerate(tokens)}
+    sent_starts = np.array(
+        [index_of[id(sent.tokens[0])] if sent.tokens else -1 for sent in doc.sents],
+        dtype=np.int64,
+    )
+
+    return {
+        "text": _column([t.text for t in tokens]),
+        "lemma_lc": _column([_lemma_lc(t) for t in tokens]),
+        "pos": _column([t.pos for t in tokens]),
+        "pos_code": np.fromiter(
+            (POS_IDS.get(t.pos, -1) for t in tokens), dtype=np.int8, count=len(tokens)
+        ),
+        "sent_starts": sent_starts,
+    }
+
+
+def _lemma_lc(token) -> str:
+    """Lowercased lemma, as precomputed by nlp_engine.process_text()."""
+    lemma_lc = getattr(token, "_lemma_lc", None)
+    if lemma_lc is None:
+        # Doc not produced by process_text()
+        lemma_lc = (token.lemma or token.text).lower()
+    return lemma_lc
+
+
+def _column(values: list) -> np.ndarray:
+    """Wrap *values* in a 1-D object array (never a fixed-width str array)."""
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
@@ -6,13 +6,22 @@ vocabulary richness metrics.
 from __future__ import annotations
 
 from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
 from natasha import Doc
 
+from .soa import build_soa
+
 # POS tags we care about for "top N" lists
 CONTENT_POS = {"NOUN", "ADJ", "VERB", "ADV", "PROPN"}
 
+# POS tags that are not counted as words
+SKIP_POS = frozenset(("PUNCT", "SYM"))
+_SKIP_POS_LIST = sorted(SKIP_POS)
+
 # Human-readable POS labels (Russian)
 POS_LABELS_RU = {
     "NOUN": "Существительное",
@@ -34,7 +43,9 @@ POS_LABELS_RU = {
 }
 
 
-def compute_statistics(doc: Doc, top_n: int = 100) -> dict[str, Any]:
+def compute_statistics(
+    doc: Doc, top_n: int = 100, soa: dict[str, np.ndarray] | None = None
+) -> dict[str, Any]:
     """
     Return a statistics dict:
     {
@@ -52,26 +63,23 @@ def compute_statistics(doc: Doc, top_n: int = 100) -> dict[str, Any]:
         "top_propn":  [ … ],
     }
     """
-    pos_counter: Counter = Counter()
-    lemma_counters: dict[str, Counter] = {pos: Counter() for pos in CONTENT_POS}
-    all_lemmas: Counter = Counter()
-    total_chars = 0
-    word_count = 0
-
-    for token in doc.tokens:
-        pos = token.pos
-        lemma = (token.lemma or token.text).lower()
-        pos_counter[pos] += 1
+    if soa is None:
+        soa = build_soa(doc)
+    pos_arr = soa["pos"]
 
-        if pos in ("PUNCT", "SYM"):
-            continue
+    # Words = everything except punctuation / symbols
+    word_idx = np.flatnonzero(~np.isin(pos_arr, _SKIP_POS_LIST))
+    word_count = int(word_idx.size)
+    total_chars = sum(map(len, soa["text"][word_idx].tolist()))
+    word_pos = pos_arr[word_idx]
+    word_lemmas = soa["lemma_lc"][word_idx]
 
-        word_count += 1
-        total_chars += len(token.text)
-        all_lemmas[lemma] += 1
-
-        if pos in CONTENT_POS:
-            lemma_counters[pos][lemma] += 1
+    # All counters are built from whole columns in one C-level pass each
+    pos_counter = Counter(pos_arr.tolist())
+    all_lemmas = Counter(word_lemmas.tolist())
+    lemma_counters: dict[str, Counter] = {
+        pos: Counter(word_lemmas[word_pos == pos].tolist()) for pos in CONTENT_POS
+    }
 
     unique = len(all_lemmas)
     richness = round(unique / word_count * 100, 2) if word_count else 0
@@ -80,11 +88,11 @@ def compute_statistics(doc: Doc, top_n: int = 100) -> dict[str, Any]:
     def _top(pos: str) -> list[dict]:
         return [
             {"lemma": lemma, "count": cnt}
-            for lemma, cnt in lemma_counters[pos].most_common(top_n)
+            for lemma, cnt in nlargest(top_n, lemma_counters[pos].items(), key=itemgetter(1))
         ]
 
     return {
-        "total_tokens": len(doc.tokens),
+        "total_tokens": len(pos_arr),
         "total_words": word_count,
         "unique_lemmas": unique,
         "vocabulary_richness": richness,
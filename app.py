@@ -16,10 +16,15 @@ DELETE /api/history/<id> → delete analysis from Supabase
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import uuid
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
 
+import orjson
 from flask import (
     Flask,
     render_template,
@@ -34,8 +39,8 @@ from flask import (
 
 from config import Config
 from analyzer import analyze_text
-from analyzer.collocations import search_adjectives_for_noun
-from storage.json_export import export_json
+from analyzer.collocations import build_noun_lookup, search_adjectives_for_noun
+from storage.json_export import iter_export_json
 
 # ── App factory ───────────────────────────────────────────────────
 app = Flask(__name__)
@@ -47,9 +52,50 @@ def _allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in Config.ALLOWED_EXTENSIONS
 
 
+def _ojsonify(obj) -> Response:
+    """jsonify() replacement backed by orjson (faster, UTF-8 output)."""
+    return Response(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str),
+        mimetype="application/json",
+    )
+
+
 # ── In-memory cache for last analysis (avoids huge session cookies) ─
 # In production, replace with Redis or DB-backed sessions.
-_analysis_cache: dict[str, dict] = {}
+class _LRUCache:
+    """Thread-safe dict with a size cap; least recently used entries are evicted."""
+
+    def __init__(self, maxsize: int):
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+_analysis_cache = _LRUCache(maxsize=Config.ANALYSIS_CACHE_SIZE)
+# Text content hash → analysis_id, so re-submitting the same text skips NLP
+_content_cache = _LRUCache(maxsize=Config.ANALYSIS_CACHE_SIZE)
+
+
+def _session_analysis() -> tuple[str | None, dict | None]:
+    """Return (analysis_id, cached entry) for the current session, if still cached."""
+    analysis_id = session.get("analysis_id")
+    if not analysis_id:
+        return None, None
+    return analysis_id, _analysis_cache.get(analysis_id)
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -97,15 +143,32 @@ def analyze():
         flash("Текст пуст. Загрузите файл или вставьте текст.", "error")
         return redirect(url_for("index"))
 
-    # Run analysis
-    result = analyze_text(text)
+    # Reuse the cached analysis of identical text, if it is still cached
+    content_key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    previous_id = _content_cache.get(content_key)
+    previous = _analysis_cache.get(previous_id) if previous_id else None
+    if previous is not None and previous["filename"] == filename:
+        session["analysis_id"] = previous_id
+        session["filename"] = filename
+        return redirect(url_for("results"))
+
+    if previous is not None:
+        # Same text under another name: share the result, new cache entry
+        result = previous["result"]
+        noun_lookup = previous["noun_lookup"]
+    else:
+        # Run analysis
+        result = analyze_text(text)
+        noun_lookup = build_noun_lookup(result["collocations"]["noun_adj_index"])
 
     # Store in cache
     analysis_id = str(uuid.uuid4())
     _analysis_cache[analysis_id] = {
         "filename": filename,
         "result": result,
+        "noun_lookup": noun_lookup,
     }
+    _content_cache[content_key] = analysis_id
     session["analysis_id"] = analysis_id
     session["filename"] = filename
 
@@ -115,12 +178,11 @@ def analyze():
 @app.route("/results")
 def results():
     """Results dashboard."""
-    analysis_id = session.get("analysis_id")
-    if not analysis_id or analysis_id not in _analysis_cache:
+    analysis_id, cached = _session_analysis()
+    if cached is None:
         flash("Нет результатов анализа. Загрузите текст.", "info")
         return redirect(url_for("index"))
 
-    cached = _analysis_cache[analysis_id]
     return render_template(
         "results.html",
         filename=cached["filename"],
@@ -136,8 +198,8 @@ def results():
 @app.route("/api/search")
 def api_search():
     """Search adjectives for a noun.  ?noun=слово&limit=20"""
-    analysis_id = session.get("analysis_id")
-    if not analysis_id or analysis_id not in _analysis_cache:
+    _, cached = _session_analysis()
+    if cached is None:
         return jsonify({"error": "No analysis in session"}), 400
 
     noun = request.args.get("noun", "").strip()
@@ -145,25 +207,26 @@ def api_search():
         return jsonify({"error": "Parameter 'noun' is required"}), 400
 
     limit = int(request.args.get("limit", 20))
-    index = _analysis_cache[analysis_id]["result"]["collocations"]["noun_adj_index"]
-    matches = search_adjectives_for_noun(index, noun, limit=limit)
+    index = cached["result"]["collocations"]["noun_adj_index"]
+    matches = search_adjectives_for_noun(
+        index, noun, limit=limit, noun_lookup=cached["noun_lookup"]
+    )
 
-    return jsonify({"noun": noun, "adjectives": matches})
+    return _ojsonify({"noun": noun, "adjectives": matches})
 
 
 @app.route("/api/export")
 def api_export():
     """Download full analysis as JSON."""
-    analysis_id = session.get("analysis_id")
-    if not analysis_id or analysis_id not in _analysis_cache:
+    _, cached = _session_analysis()
+    if cached is None:
         return jsonify({"error": "No analysis in session"}), 400
 
-    cached = _analysis_cache[analysis_id]
-    json_str = export_json(cached["result"])
     filename = cached["filename"].rsplit(".", 1)[0] + "_analysis.json"
 
+    # Streamed chunk by chunk instead of building the whole string first
     return Response(
-        json_str,
+        iter_export_json(cached["result"]),
         mimetype="application/json",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -172,14 +235,13 @@ def api_export():
 @app.route("/api/save", methods=["POST"])
 def api_save():
     """Save current analysis to Supabase."""
-    analysis_id = session.get("analysis_id")
-    if not analysis_id or analysis_id not in _analysis_cache:
+    _, cached = _session_analysis()
+    if cached is None:
         return jsonify({"error": "No analysis in session"}), 400
 
     try:
         from storage.supabase_client import save_to_supabase
 
-        cached = _analysis_cache[analysis_id]
         record = save_to_supabase(cached["result"], cached["filename"])
         return jsonify({"success": True, "record": record})
     except Exception as e:
@@ -224,6 +286,9 @@ def load_from_history(analysis_id):
         _analysis_cache[cache_id] = {
             "filename": data.get("filename", "saved"),
             "result": result,
+            "noun_lookup": build_noun_lookup(
+                result["collocations"].get("noun_adj_index", {})
+            ),
         }
         session["analysis_id"] = cache_id
         session["filename"] = data.get("filename", "saved")
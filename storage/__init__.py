@@ -1,2 +1,2 @@
-from .json_export import export_json  # noqa: F401
+from .json_export import export_json, iter_export_json  # noqa: F401
 from .supabase_client import save_to_supabase  # noqa: F401
@@ -1,18 +1,105 @@
 """
 JSON export — serialises the analysis result to a downloadable JSON file.
+
+Pretty output uses orjson (C implementation, native UTF-8): the stdlib
+json module's indenting path is pure Python and slow on large
+dictionaries.  For the analysis payloads this app produces the pretty
+output is identical to json.dumps(indent=2, ensure_ascii=False); floats
+in exponent form are the one known difference (orjson writes 1e16 /
+1e-7 where stdlib json writes 1e+16 / 1e-07).  Compact output stays on
+stdlib json, whose compact path is already C-accelerated, so its
+", " / ": " separators are unchanged.
 """
 
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Iterator
+
+import orjson
+
+# Approximate size of each chunk yielded by iter_export_json()
+_CHUNK_BYTES = 64 * 1024
 
 
 def export_json(analysis: dict[str, Any], pretty: bool = True) -> str:
     """Return analysis dict as a JSON string (UTF-8, Russian-safe)."""
-    return json.dumps(
-        analysis,
-        ensure_ascii=False,
-        indent=2 if pretty else None,
-        default=str,
+    if pretty:
+        return _dumps(analysis, pretty, 0).decode("utf-8")
+    return json.dumps(analysis, ensure_ascii=False, default=str)
+
+
+def iter_export_json(analysis: dict[str, Any], pretty: bool = True) -> Iterator[bytes]:
+    """
+    Yield the same UTF-8 document as export_json() in ~64 KB chunks.
+
+    Dicts and lists are walked recursively and only list elements (the
+    dictionary entries, collocation records, …) are serialised whole, so
+    memory use is bounded by the chunk size and the largest single list
+    element rather than by the size of the document.
+    """
+    buffer: list[bytes] = []
+    size = 0
+    for piece in _iter_pieces(analysis, pretty, 0):
+        buffer.append(piece)
+        size += len(piece)
+        if size >= _CHUNK_BYTES:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _iter_pieces(value: Any, pretty: bool, depth: int) -> Iterator[bytes]:
+    """Yield *value*, nested *depth* levels deep, as small serialised pieces."""
+    if isinstance(value, dict):
+        if not value:
+            yield b"{}"
+            return
+        opening, closing = b"{", b"}"
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            yield b"[]"
+            return
+        opening, closing = b"[", b"]"
+    else:
+        yield _dumps(value, pretty, depth)
+        return
+
+    if pretty:
+        item_prefix = b"\n" + b"  " * (depth + 1)
+        separator = b"," + item_prefix
+        end = b"\n" + b"  " * depth + closing
+    else:
+        item_prefix = b""
+        separator = b", "
+        end = closing
+
+    yield opening + item_prefix
+    if opening == b"{":
+        for n, (key, item) in enumerate(value.items()):
+            if not isinstance(key, str):
+                # Same key coercion as the stdlib encoder (1 → "1", None → "null")
+                key = json.dumps(key)
+            yield (separator if n else b"") + _dumps(key, pretty, 0) + b": "
+            yield from _iter_pieces(item, pretty, depth + 1)
+    else:
+        for n, item in enumerate(value):
+            if n:
+                yield separator
+            yield _dumps(item, pretty, depth + 1)
+    yield end
+
+
+def _dumps(value: Any, pretty: bool, depth: int) -> bytes:
+    """Serialise *value*; in pretty mode, indent it to sit *depth* levels deep."""
+    if not pretty:
+        return json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+    body = orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2, default=str
     )
+    if depth and b"\n" in body:
+        # Raw newlines only occur between tokens (strings escape them)
+        body = body.replace(b"\n", b"\n" + b"  " * depth)
+    return body
@@ -32,16 +32,23 @@ from typing import Any
 from config import Config
 
 
+# Created on first use and reused, so its HTTP connections are kept alive
+_client = None
+
+
 def _get_client():
     """Lazy import + init so the app starts even without supabase creds."""
-    if not Config.SUPABASE_URL or not Config.SUPABASE_KEY:
-        raise RuntimeError(
-            "Supabase credentials not configured.  "
-            "Set SUPABASE_URL and SUPABASE_KEY in your .env file."
-        )
-    from supabase import create_client
-
-    return create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+    global _client
+    if _client is None:
+        if not Config.SUPABASE_URL or not Config.SUPABASE_KEY:
+            raise RuntimeError(
+                "Supabase credentials not configured.  "
+                "Set SUPABASE_URL and SUPABASE_KEY in your .env file."
+            )
+        from supabase import create_client
+
+        _client = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+    return _client
 
 
 def save_to_supabase(